@@ -61,6 +61,7 @@ def __init__(
         *,
         max_block_size: int = LIMITS.MAX_BLOCK_SIZE,
         emit_section_end_events: bool = True,
+        emit_block_deltas: bool = True,
         logger: Logger | None = None,
     ) -> None:
         """Initialize the block state machine.
@@ -71,12 +72,16 @@ def __init__(
             max_block_size: Maximum block size in bytes before rejection
             emit_section_end_events: Whether to emit BlockMetadataEndEvent and
                 BlockContentEndEvent when sections complete. Default True.
+            emit_block_deltas: Whether to emit a header/metadata/content delta
+                event for each line inside a block. Default True.
             logger: Optional logger for debug output
         """
         self._syntax = syntax
+        self._syntax_name = get_syntax_name(syntax)  # Candidates all share this syntax
         self._registry = registry
         self._max_block_size = max_block_size
         self._emit_section_end_events = emit_section_end_events
+        self._emit_block_deltas = emit_block_deltas
         self._logger = logger or StdlibLoggerAdapter(logging.getLogger(__name__))
 
         # State
@@ -95,9 +100,10 @@ def has_active_candidates(self) -> bool:
 
     def get_block_id(self, candidate_start_line: int) -> str:
         """Get or create a block_id for a candidate."""
-        if candidate_start_line not in self._block_ids:
-            self._block_ids[candidate_start_line] = str(uuid4())
-        return self._block_ids[candidate_start_line]
+        block_id = self._block_ids.get(candidate_start_line)
+        if block_id is None:
+            block_id = self._block_ids[candidate_start_line] = str(uuid4())
+        return block_id
 
     def get_current_section(self) -> str | None:
         """Get the current section of the first active candidate."""
@@ -121,27 +127,20 @@ def process_line(self, line: str, line_number: int) -> list[Event]:
         Returns:
             List of events generated from processing this line
         """
-        events: list[Event] = []
-
-        # 1. Handle active candidates
-        handled, candidate_events = self._process_active_candidates(line, line_number)
-        events.extend(candidate_events)
-
-        # 2. Check for new blocks if not handled
-        if not handled:
-            new_block_events = self._check_new_blocks(line, line_number)
-            events.extend(new_block_events)
+        # Plain text between blocks: only opening detection applies
+        if not self._candidates:
+            return self._check_new_blocks(line, line_number)
 
-        return events
+        # Inside a block every line belongs to the active candidates
+        return self._process_active_candidates(line, line_number)
 
-    def _process_active_candidates(self, line: str, line_number: int) -> tuple[bool, list[Event]]:
+    def _process_active_candidates(self, line: str, line_number: int) -> list[Event]:
         """Process line against all active candidates.
 
         Returns:
-            Tuple of (handled, events)
+            List of events generated for the candidates
         """
         events: list[Event] = []
-        handled = False
 
         for candidate in list(self._candidates):
             # Capture section BEFORE detect_line (which may modify it)
@@ -152,15 +151,12 @@ def _process_active_candidates(self, line: str, line_number: int) -> tuple[bool,
 
             if detection.is_closing:
                 events.extend(self._handle_closing(candidate, line, line_number))
-                handled = True
             elif detection.is_metadata_boundary:
                 events.extend(self._handle_boundary(candidate, line, line_number, old_section))
-                handled = True
             else:
                 events.extend(self._handle_content(candidate, line, line_number))
-                handled = True
 
-        return handled, events
+        return events
 
     def _handle_closing(self, candidate: BlockCandidate, line: str, line_number: int) -> list[Event]:
         """Handle block closing detection."""
@@ -203,7 +199,8 @@ def _handle_boundary(self, candidate: BlockCandidate, line: str, line_number: in
         candidate.add_line(line)
 
         # Emit section-specific delta event with boundary flag
-        events.append(self._create_section_delta_event(candidate, line, line_number, is_boundary=True))
+        if self._emit_block_deltas:
+            events.append(self._create_section_delta_event(candidate, line, line_number, is_boundary=True))
 
         # Check if metadata section just ended (transition to content)
         if (
@@ -245,7 +242,7 @@ def _handle_content(self, candidate: BlockCandidate, line: str, line_number: int
         candidate.add_line(line)
 
         # Check size limit
-        if len(candidate.raw_text) > self._max_block_size:
+        if candidate.size > self._max_block_size:
             events.append(
                 self._create_error_event(
                     candidate,
@@ -258,7 +255,8 @@ def _handle_content(self, candidate: BlockCandidate, line: str, line_number: int
             return events
 
         # Emit section-specific delta event
-        events.append(self._create_section_delta_event(candidate, line, line_number))
+        if self._emit_block_deltas:
+            events.append(self._create_section_delta_event(candidate, line, line_number))
         return events
 
     def _check_new_blocks(self, line: str, line_number: int) -> list[Event]:
@@ -273,6 +271,7 @@ def _check_new_blocks(self, line: str, line_number: int) -> list[Event]:
             # Start new candidate
             candidate = BlockCandidate(self._syntax, line_number)
             candidate.add_line(line)
+            candidate.opening_detection = detection
 
             # If syntax provided inline metadata, store it
             if detection.metadata:
@@ -503,7 +502,7 @@ def _try_extract_block(
             block_type=block_type,
             start_line=candidate.start_line,
             end_line=line_number,
-            size_bytes=len(candidate.raw_text),
+            size_bytes=candidate.size,
         )
 
         # Handle parse failure
@@ -559,8 +558,8 @@ def _create_section_delta_event(
         """
         block_id = self.get_block_id(candidate.start_line)
         section = candidate.current_section or SectionType.CONTENT
-        syntax_name = get_syntax_name(candidate.syntax)
-        accumulated_size = len(candidate.raw_text)
+        syntax_name = self._syntax_name
+        accumulated_size = candidate.size
 
         if section == SectionType.HEADER:
             return BlockHeaderDeltaEvent(
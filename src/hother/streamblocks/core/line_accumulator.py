@@ -69,17 +69,21 @@ def add_text(self, text: str) -> list[tuple[int, str]]:
         if not text:
             return []
 
-        # Accumulate text
-        self._accumulated_text.append(text)
+        # No newline yet: just buffer the fragment, without rejoining the
+        # pending text on every chunk of a long line
+        if "\n" not in text:
+            self._accumulated_text.append(text)
+            return []
 
-        # Check if we have complete lines
-        full_text = "".join(self._accumulated_text)
-        lines = full_text.split("\n")
+        # Only the new text is split; pending fragments complete its first line
+        lines = text.split("\n")
+        if self._accumulated_text:
+            self._accumulated_text.append(lines[0])
+            lines[0] = "".join(self._accumulated_text)
 
         # Keep incomplete line for next iteration
-        if not full_text.endswith("\n"):
-            self._accumulated_text = [lines[-1]]
-            lines = lines[:-1]
+        if not text.endswith("\n"):
+            self._accumulated_text = [lines.pop()]
         else:
             self._accumulated_text = []
 
@@ -5,7 +5,8 @@
 import hashlib
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
+from types import NoneType, UnionType
+from typing import TYPE_CHECKING, Any, ClassVar, Self, Union, cast, get_args, get_origin
 
 import yaml
 from pydantic import BaseModel, Field
@@ -14,6 +15,7 @@
 from hother.streamblocks.core.types import BaseContent, BaseMetadata, BlockState, SectionType
 
 if TYPE_CHECKING:
+    from hother.streamblocks.core.types import DetectionResult
     from hother.streamblocks.syntaxes.base import BaseSyntax
 
 # YAML frontmatter delimiters for markdown examples files
@@ -22,12 +24,48 @@
 _FRONTMATTER_PART_COUNT = 3
 
 
+def construct_trusted[T: BaseModel](model_class: type[T], data: dict[str, Any]) -> T:
+    """``model_construct()`` that also rebuilds nested models from their dicts.
+
+    Used for trusted input by :meth:`Block.from_trusted_dict` and by syntaxes
+    with ``trust_input`` set. Fields annotated with a model class, an optional
+    model, or a list or dict of models are constructed recursively. Values of
+    any other shape (e.g. a union of several model classes) are kept exactly
+    as given.
+    """
+    values = dict(data)
+    for name, field in model_class.model_fields.items():
+        if name in values:
+            values[name] = _construct_trusted_value(field.annotation, values[name])
+    return model_class.model_construct(**values)
+
+
+def _construct_trusted_value(annotation: Any, value: Any) -> Any:
+    """Rebuild ``value`` for a field annotated with ``annotation``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return construct_trusted(annotation, cast("dict[str, Any]", value)) if isinstance(value, dict) else value
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list and args and isinstance(value, list):
+        return [_construct_trusted_value(args[0], item) for item in cast("list[Any]", value)]
+    if origin is dict and args and isinstance(value, dict):
+        # args is (key type, value type); only the values can be models
+        return {key: _construct_trusted_value(args[-1], item) for key, item in cast("dict[Any, Any]", value).items()}
+    if origin in (Union, UnionType):
+        members = [arg for arg in args if arg is not NoneType]
+        if len(members) == 1:
+            return _construct_trusted_value(members[0], value)
+    return value
+
+
 def extract_block_types(block_class: type[Any]) -> tuple[type[BaseMetadata], type[BaseContent]]:
     """Extract metadata and content type parameters from a Block class.
 
     For classes inheriting from Block[M, C], Pydantic resolves the concrete
     types and stores them in the field annotations during class definition.
-    This function extracts those resolved types from model_fields.
+    Block subclasses record the resolved pair once, when the class is built;
+    other classes are resolved from model_fields on each call.
 
     Args:
         block_class: The block class to extract types from
@@ -35,6 +73,14 @@ def extract_block_types(block_class: type[Any]) -> tuple[type[BaseMetadata], typ
     Returns:
         Tuple of (metadata_class, content_class)
     """
+    block_types: tuple[type[BaseMetadata], type[BaseContent]] | None = getattr(block_class, "__block_types__", None)
+    if block_types is not None:
+        return block_types
+    return _resolve_block_types(block_class)
+
+
+def _resolve_block_types(block_class: type[Any]) -> tuple[type[BaseMetadata], type[BaseContent]]:
+    """Resolve (metadata_class, content_class) from a class's model_fields."""
     # Extract type parameters from Pydantic field annotations
     # Pydantic resolves Block[M, C] generics during class definition
     if issubclass(block_class, BaseModel):
@@ -57,14 +103,17 @@ class BlockCandidate:
     """Tracks a potential block being accumulated."""
 
     __slots__ = (
+        "_lines",
+        "_raw_text",
+        "_size",
         "content_lines",
         "content_validation_error",
         "content_validation_passed",
         "current_section",
-        "lines",
         "metadata_lines",
         "metadata_validation_error",
         "metadata_validation_passed",
+        "opening_detection",
         "parsed_content",
         "parsed_metadata",
         "start_line",
@@ -81,12 +130,18 @@ def __init__(self, syntax: BaseSyntax, start_line: int) -> None:
         """
         self.syntax = syntax
         self.start_line = start_line
-        self.lines: list[str] = []
+        self._lines: list[str] = []
+        self._raw_text: str | None = None  # Memoized "\n".join(lines)
+        self._size = 0  # len(raw_text), kept up to date by add_line
         self.state = BlockState.HEADER_DETECTED
         self.metadata_lines: list[str] = []
         self.content_lines: list[str] = []
         self.current_section: SectionType = SectionType.HEADER
 
+        # Detection result for the opening line, so syntaxes can reuse its
+        # inline metadata instead of re-parsing lines[0]
+        self.opening_detection: DetectionResult | None = None
+
         # Cache fields for early parsing results
         self.parsed_metadata: dict[str, Any] | None = None
         self.parsed_content: dict[str, Any] | None = None
@@ -97,9 +152,35 @@ def __init__(self, syntax: BaseSyntax, start_line: int) -> None:
         self.content_validation_passed: bool = True
         self.content_validation_error: str | None = None
 
+    @property
+    def lines(self) -> list[str]:
+        """All accumulated lines, including the opening and closing markers.
+
+        Append through :meth:`add_line` so the memoized :attr:`raw_text` and
+        :attr:`size` stay in sync; assigning a new list also resets them and
+        drops the recorded :attr:`opening_detection`.
+        """
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: list[str]) -> None:
+        self._lines = value
+        self._raw_text = None
+        self.opening_detection = None
+        self._size = sum(map(len, value)) + max(len(value) - 1, 0)
+
+    @property
+    def size(self) -> int:
+        """Length of :attr:`raw_text`, without joining the lines."""
+        return self._size
+
     def add_line(self, line: str) -> None:
         """Add a line to the candidate."""
-        self.lines.append(line)
+        if self._lines:
+            self._size += 1  # Newline separator
+        self._size += len(line)
+        self._lines.append(line)
+        self._raw_text = None
 
     def transition_to_metadata(self) -> None:
         """Transition from header to metadata section.
@@ -145,13 +226,31 @@ def cache_content_validation(self, passed: bool, error: str | None) -> None:
 
     @property
     def raw_text(self) -> str:
-        """Get the raw text of all accumulated lines."""
-        return "\n".join(self.lines)
+        """Get the raw text of all accumulated lines.
+
+        The joined text is memoized until the next line is added.
+        """
+        if self._raw_text is None:
+            self._raw_text = "\n".join(self._lines)
+        return self._raw_text
 
     def compute_hash(self) -> str:
-        """Compute hash of first N chars for ID (N defined in constants)."""
-        text_slice = self.raw_text[: LIMITS.HASH_PREFIX_LENGTH]
-        return hashlib.sha256(text_slice.encode()).hexdigest()[:8]
+        """Compute hash of first N chars for ID (N defined in constants).
+
+        Only the leading lines that cover the prefix are joined, so the cost
+        does not grow with the size of the block.
+        """
+        limit = LIMITS.HASH_PREFIX_LENGTH
+        prefix_lines: list[str] = []
+        joined_length = -1  # No separator before the first line
+        for line in self.lines:
+            prefix_lines.append(line)
+            joined_length += len(line) + 1
+            if joined_length >= limit:
+                break
+        text_slice = "\n".join(prefix_lines)[:limit]
+        # First 4 digest bytes == first 8 hex chars, without the 64-char hexdigest
+        return hashlib.sha256(text_slice.encode()).digest()[:4].hex()
 
     def __repr__(self) -> str:
         """Return a developer-friendly string representation."""
@@ -192,6 +291,15 @@ class YesNo(Block[YesNoMetadata, YesNoContent]):
     _dynamic_examples: ClassVar[dict[type, list[Any]]] = {}
     # Cache of file-loaded examples keyed by (class, resolved_path, mtime).
     _examples_file_cache: ClassVar[dict[tuple[type, str, float], list[Any]]] = {}
+    # Resolved (metadata_class, content_class), set once per subclass when
+    # Pydantic finishes building it. None while forward references are pending.
+    __block_types__: ClassVar[tuple[type[BaseMetadata], type[BaseContent]] | None] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Record the resolved metadata and content classes of the subclass."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__block_types__ = _resolve_block_types(cls) if cls.__pydantic_complete__ else None
 
     @classmethod
     def add_example(cls, example: Self | dict[str, Any]) -> None:
@@ -233,6 +341,39 @@ def get_examples(cls) -> list[Self]:
         examples.extend(cls._dynamic_examples.get(cls, []))
         return examples
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> Self:
+        """Rebuild a block from its own ``model_dump()`` output without validation.
+
+        Intended for data this application serialized itself, such as a cache
+        of previously extracted blocks: the metadata and content mappings are
+        turned into this block's declared metadata and content classes with
+        ``model_construct``, skipping validation and type coercion entirely.
+        Use ``model_validate`` for anything that did not come from a block.
+
+        Nested models are rebuilt too when their field is annotated with a
+        model class, an optional model, or a list or dict of models. Fields
+        typed as a union of several models cannot be resolved without
+        validation and keep their plain dict values.
+
+        Args:
+            data: Dict with ``metadata`` and ``content`` mappings, plus any
+                extra fields of the concrete class (e.g. ExtractedBlock's
+                line numbers and hash).
+
+        Returns:
+            The reconstructed block instance
+        """
+        metadata_class, content_class = extract_block_types(cls)
+        fields = dict(data)
+        metadata = fields.get("metadata")
+        if isinstance(metadata, dict):
+            fields["metadata"] = construct_trusted(metadata_class, cast("dict[str, Any]", metadata))
+        content = fields.get("content")
+        if isinstance(content, dict):
+            fields["content"] = construct_trusted(content_class, cast("dict[str, Any]", content))
+        return cls.model_construct(**fields)
+
     @classmethod
     def _example_from_dict(cls, data: dict[str, Any]) -> Self:
         """Validate an example dict into an instance, auto-filling raw_content."""
@@ -8,6 +8,7 @@
 
 import yaml
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from hother.streamblocks.core.types import BaseContent
 
@@ -22,6 +23,20 @@ class ParseStrategy(StrEnum):
     PERMISSIVE = auto()  # Fall back to raw_content on error
 
 
+def _load_json(raw_text: str) -> Any:
+    """Decode JSON with pydantic's jiter parser, falling back to ``json``.
+
+    jiter is several times faster than ``json.loads`` on small payloads but
+    stricter on a few inputs (e.g. lone surrogate escapes) and reports errors
+    as plain ``ValueError``. Retrying with the stdlib keeps its behaviour and
+    its ``JSONDecodeError`` for anything jiter rejects.
+    """
+    try:
+        return from_json(raw_text)
+    except ValueError:
+        return json.loads(raw_text)
+
+
 def parse_as_yaml[T: BaseContent](
     *,
     strategy: ParseStrategy = ParseStrategy.PERMISSIVE,
@@ -100,7 +115,7 @@ def parse(cls_inner: type[T], raw_text: str) -> T:
                 return cls_inner(raw_content=raw_text)
 
             try:
-                loaded_data: dict[str, Any] | str | None = json.loads(raw_text)
+                loaded_data: dict[str, Any] | str | None = _load_json(raw_text)
                 if isinstance(loaded_data, dict):
                     data: dict[str, Any] = loaded_data
                 elif handle_non_dict:
@@ -67,6 +67,9 @@ class ProcessorConfig:
             Enables character-level streaming for live UIs. Disable to reduce event volume.
         emit_section_end_events: Whether to emit section end events (default: True).
             Controls BlockMetadataEndEvent and BlockContentEndEvent emission for early validation.
+        emit_block_deltas: Whether to emit per-line block delta events (default: True).
+            Controls BlockHeaderDeltaEvent, BlockMetadataDeltaEvent and BlockContentDeltaEvent.
+            Disable when only complete blocks (BlockEndEvent) are consumed.
         auto_detect_adapter: Whether to auto-detect input adapter from first chunk (default: True).
             When False, uses IdentityInputAdapter. Disable for performance with known adapter.
 
@@ -92,6 +95,7 @@ class ProcessorConfig:
     emit_original_events: bool = True
     emit_text_deltas: bool = True
     emit_section_end_events: bool = True
+    emit_block_deltas: bool = True
     auto_detect_adapter: bool = True
 
 
@@ -150,6 +154,7 @@ def __init__(
             registry=registry,
             max_block_size=self.config.max_block_size,
             emit_section_end_events=self.config.emit_section_end_events,
+            emit_block_deltas=self.config.emit_block_deltas,
             logger=self.logger,
         )
         self._stream_state = StreamState()
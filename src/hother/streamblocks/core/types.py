@@ -461,7 +461,13 @@ class CustomEvent(BaseEvent):
 
 
 class DetectionResult(BaseModel):
-    """Result from syntax detection attempt."""
+    """Result from syntax detection attempt.
+
+    Frozen so syntaxes can return one shared instance for the common
+    "nothing detected" case instead of building a model per line.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     is_opening: bool = False
     is_closing: bool = False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from hother.streamblocks.core.processor import ProcessorConfig, StreamBlockProcessor
@@ -32,8 +33,12 @@ def __init__(
         Args:
             registry: Registry with a single syntax
             config: Configuration object for processor settings
-            enable_partial_blocks: Whether to emit section delta events for partial blocks
+            enable_partial_blocks: Whether to emit section delta events for partial blocks.
+                When False, overrides ``config.emit_block_deltas`` so the per-line
+                delta events are never built.
         """
+        if not enable_partial_blocks:
+            config = replace(config or ProcessorConfig(), emit_block_deltas=False)
         super().__init__(registry, config=config)
         self.enable_partial_blocks = enable_partial_blocks
 
@@ -62,7 +67,9 @@ async def process_agent_with_events(
         """Process agent stream with optional event handler for agent-specific events.
 
         This allows handling both StreamBlocks events and PydanticAI events
-        in a unified manner.
+        in a unified manner. The handler is awaited before each event is
+        yielded, so it observes events in stream order; slow handlers should
+        offload their I/O to a task or queue.
 
         Args:
             agent_stream: Async iterator from agent streaming
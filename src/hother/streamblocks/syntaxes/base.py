@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import yaml
 from pydantic import ValidationError
 
+from hother.streamblocks.core.models import construct_trusted
+
 # Import BaseMetadata at module level for runtime isinstance checks
 from hother.streamblocks.core.types import BaseMetadata, ParseResult
 
@@ -19,6 +24,56 @@
 # Module-level logger for debugging YAML parsing failures
 _logger = logging.getLogger(__name__)
 
+# A flat "key: value" line whose value YAML can only read as a plain string:
+# ASCII words starting with a letter, no quotes, flow/block indicators,
+# comments or nested mappings. Anything else is left to the YAML parser.
+_SIMPLE_KV_PATTERN = re.compile(r"([A-Za-z_][\w-]*):(?: +([A-Za-z_][\w./-]*(?: [\w./-]+)*))? *", re.ASCII)
+
+# Plain scalars that YAML resolves to bool or null rather than a string
+_NON_STRING_SCALARS = frozenset(
+    {
+        *("yes", "Yes", "YES", "no", "No", "NO", "on", "On", "ON", "off", "Off", "OFF"),
+        *("true", "True", "TRUE", "false", "False", "FALSE"),
+        *("null", "Null", "NULL"),
+    }
+)
+
+
+def _try_simple_yaml(metadata_lines: list[str]) -> dict[str, Any] | None:
+    """Parse trivial ``key: value`` frontmatter without the YAML parser.
+
+    Args:
+        metadata_lines: Lines containing YAML content
+
+    Returns:
+        The parsed mapping, identical to what ``yaml.safe_load`` would return,
+        or None if any line needs the full YAML grammar
+    """
+    result: dict[str, Any] = {}
+    for line in metadata_lines:
+        if not line.strip(" "):
+            continue
+        match = _SIMPLE_KV_PATTERN.fullmatch(line)
+        if match is None:
+            return None
+        key, value = match.groups()
+        if key in _NON_STRING_SCALARS or value in _NON_STRING_SCALARS:
+            return None
+        result[key] = value
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _load_yaml_cached(yaml_content: str) -> Any:
+    """Run ``yaml.safe_load`` once per distinct frontmatter text.
+
+    A block's frontmatter is parsed several times (block type extraction,
+    early metadata, final parse), and agent streams repeat the same
+    frontmatter across turns. Callers must deep-copy the result, since it
+    is shared between cache hits. Errors are not cached.
+    """
+    return yaml.safe_load(yaml_content)
+
 
 class YAMLFrontmatterMixin:
     """Mixin providing YAML frontmatter parsing utilities.
@@ -35,6 +90,9 @@ class YAMLFrontmatterMixin:
         ...         return metadata.get("block_type") if metadata else None
     """
 
+    # "---" boundary line; compiled once and shared by every syntax instance
+    _frontmatter_pattern: ClassVar[re.Pattern[str]] = re.compile(r"---\s*")
+
     def _parse_yaml_metadata(self, metadata_lines: list[str]) -> dict[str, Any] | None:
         """Parse YAML from metadata lines. Returns None on error.
 
@@ -46,9 +104,12 @@ def _parse_yaml_metadata(self, metadata_lines: list[str]) -> dict[str, Any] | No
         """
         if not metadata_lines:
             return None
+        simple = _try_simple_yaml(metadata_lines)
+        if simple is not None:
+            return simple
         yaml_content = "\n".join(metadata_lines)
         try:
-            return yaml.safe_load(yaml_content) or {}
+            return copy.deepcopy(_load_yaml_cached(yaml_content)) or {}
         except yaml.YAMLError as e:
             # Log parse failure for debugging
             _logger.debug(
@@ -72,9 +133,12 @@ def _parse_yaml_metadata_strict(self, metadata_lines: list[str]) -> tuple[dict[s
         """
         if not metadata_lines:
             return {}, None
+        simple = _try_simple_yaml(metadata_lines)
+        if simple is not None:
+            return simple, None
         yaml_content = "\n".join(metadata_lines)
         try:
-            return yaml.safe_load(yaml_content) or {}, None
+            return copy.deepcopy(_load_yaml_cached(yaml_content)) or {}, None
         except yaml.YAMLError as e:
             return {}, e
 
@@ -110,6 +174,10 @@ class BaseSyntax(ABC):
         ...         pass
     """
 
+    # When True, metadata dicts are assumed to already match the metadata model
+    # and are built with model_construct(), skipping pydantic validation
+    trust_input: bool = False
+
     # Abstract methods that must be implemented by subclasses
 
     @abstractmethod
@@ -187,6 +255,12 @@ def _safe_parse_metadata(
         Handles ValidationError and returns either the parsed metadata or a
         ParseResult with error information.
 
+        When :attr:`trust_input` is set, the metadata is built with
+        ``model_construct()``: defaults are applied and nested models are
+        rebuilt from their dicts, but values are neither validated nor
+        coerced. Missing required fields are still reported as a failed
+        ParseResult.
+
         Args:
             metadata_class: The metadata class to instantiate
             data: Dictionary of metadata fields
@@ -194,6 +268,19 @@ def _safe_parse_metadata(
         Returns:
             Parsed metadata instance, or ParseResult with error on failure
         """
+        if self.trust_input:
+            metadata = construct_trusted(metadata_class, data)
+            missing = [
+                name
+                for name, field in metadata_class.model_fields.items()
+                if field.is_required() and name not in metadata.model_fields_set
+            ]
+            if missing:
+                return ParseResult(
+                    success=False,
+                    error=f"Metadata validation error: missing required fields {', '.join(missing)}",
+                )
+            return metadata
         try:
             return metadata_class(**data)
         except ValidationError as e:
@@ -17,6 +17,27 @@
 # Minimum lines required for a block (header + closing delimiter)
 _MIN_BLOCK_LINES = 2
 
+# Sections during which the syntax is still accumulating metadata
+_METADATA_SECTIONS = frozenset({SectionType.HEADER, SectionType.METADATA})
+
+# Shared results for detections that carry no metadata; DetectionResult is frozen
+_NO_DETECTION = DetectionResult()
+_OPENING_DETECTION = DetectionResult(is_opening=True)
+_CLOSING_DETECTION = DetectionResult(is_closing=True)
+_BOUNDARY_DETECTION = DetectionResult(is_metadata_boundary=True)
+
+
+def _inner_text(candidate: BlockCandidate) -> str:
+    """Return the text between a candidate's first and last lines.
+
+    Equivalent to ``"\n".join(candidate.lines[1:-1])`` but sliced from the
+    memoized ``raw_text``, which the state machine needs for the extracted
+    block anyway, so the block body is only joined once.
+    """
+    lines = candidate.lines
+    raw_text = candidate.raw_text
+    return raw_text[len(lines[0]) + 1 : len(raw_text) - len(lines[-1]) - 1]
+
 
 @runtime_checkable
 class ContentParser(Protocol):
@@ -70,26 +91,33 @@ class DelimiterPreambleSyntax(BaseSyntax):
 
     Args:
         delimiter: Opening delimiter string (default: "!!")
+        trust_input: Build metadata without pydantic validation (default: False)
     """
 
     def __init__(
         self,
         delimiter: str = "!!",
+        *,
+        trust_input: bool = False,
     ) -> None:
         """Initialize delimiter preamble syntax.
 
         Args:
             delimiter: Delimiter string to use
+            trust_input: Skip metadata validation for trusted streams
         """
         self.delimiter = delimiter
-        self._opening_pattern = re.compile(rf"^{re.escape(delimiter)}(\w+):(\w+)(:.+)?$")
-        self._closing_pattern = re.compile(rf"^{re.escape(delimiter)}end$")
+        self.trust_input = trust_input
+        self._opening_pattern = re.compile(rf"{re.escape(delimiter)}(\w+):(\w+)(:.+)?")
+        # The closing marker is a fixed string, checked with plain equality
+        self._closing_marker = f"{delimiter}end"
 
     def detect_line(self, line: str, candidate: BlockCandidate | None = None) -> DetectionResult:
         """Detect delimiter-based markers."""
         if candidate is None:
-            # Looking for opening
-            match = self._opening_pattern.match(line)
+            # Looking for opening; most stream lines are plain text, so reject
+            # them with a literal prefix check before running the regex
+            match = self._opening_pattern.fullmatch(line) if line.startswith(self.delimiter) else None
             if match:
                 block_id, block_type, params = match.groups()
                 metadata_dict: dict[str, object] = {
@@ -107,10 +135,16 @@ def detect_line(self, line: str, candidate: BlockCandidate | None = None) -> Det
                     metadata=metadata_dict,  # Inline metadata
                 )
         # Check for closing
-        elif self._closing_pattern.match(line):
-            return DetectionResult(is_closing=True)
+        elif line == self._closing_marker:
+            return _CLOSING_DETECTION
 
-        return DetectionResult()
+        return _NO_DETECTION
+
+    def _detect_opening(self, candidate: BlockCandidate) -> DetectionResult:
+        """Return the candidate's opening detection, parsing lines[0] only if it was not recorded."""
+        if candidate.opening_detection is not None:
+            return candidate.opening_detection
+        return self.detect_line(candidate.lines[0], None)
 
     def should_accumulate_metadata(self, candidate: BlockCandidate) -> bool:
         """No separate metadata section for this syntax."""
@@ -122,7 +156,7 @@ def extract_block_type(self, candidate: BlockCandidate) -> str | None:
             return None
 
         # Parse the opening line to get block_type
-        detection = self.detect_line(candidate.lines[0], None)
+        detection = self._detect_opening(candidate)
         if detection.metadata and "block_type" in detection.metadata:
             return str(detection.metadata["block_type"])
 
@@ -143,22 +177,20 @@ def parse_block(
             metadata_class, content_class = extract_block_types(block_class)
 
         # Metadata was already extracted during detection
-        detection = self.detect_line(candidate.lines[0], None)
+        detection = self._detect_opening(candidate)
 
         if not detection.metadata:
             return ParseResult(success=False, error="Missing metadata in preamble")
 
-        # Convert all metadata values to strings for type safety
+        # Preamble values are regex captures (already strings); pydantic performs
+        # any further coercion to the declared field types in a single pass.
         # Note: id and block_type are always set by detect_line()
-        typed_metadata = {k: str(v) for k, v in detection.metadata.items()}
-
-        # Parse metadata using helper
-        metadata = self._safe_parse_metadata(metadata_class, typed_metadata)
+        metadata = self._safe_parse_metadata(metadata_class, detection.metadata)
         if isinstance(metadata, ParseResult):
             return metadata  # Return error
 
         # Parse content (skip first and last lines)
-        content_text = "\n".join(candidate.lines[1:-1])
+        content_text = _inner_text(candidate)
 
         # Parse content using helper
         content = self._safe_parse_content(content_class, content_text)
@@ -180,11 +212,10 @@ def parse_metadata_early(self, candidate: BlockCandidate) -> dict[str, Any] | No
         if not candidate.lines:
             return None
 
-        detection = self.detect_line(candidate.lines[0], None)
-        if detection.metadata:
-            # Convert all values to strings for consistency
-            return {k: str(v) for k, v in detection.metadata.items()}
-        return None
+        detection = self._detect_opening(candidate)
+        # Values are regex captures, so they are strings already. Copy so that
+        # metadata validators cannot mutate the cached detection.
+        return dict(detection.metadata) if detection.metadata else None
 
     def parse_content_early(self, candidate: BlockCandidate) -> dict[str, Any] | None:
         """Parse content section early.
@@ -195,8 +226,10 @@ def parse_content_early(self, candidate: BlockCandidate) -> dict[str, Any] | Non
             return None
 
         # Content is all lines except first (header) and last (closing)
-        content_lines = candidate.lines[1:-1] if len(candidate.lines) > _MIN_BLOCK_LINES else candidate.lines[1:]
-        raw_content = "\n".join(content_lines)
+        if len(candidate.lines) > _MIN_BLOCK_LINES:
+            raw_content = _inner_text(candidate)
+        else:
+            raw_content = "\n".join(candidate.lines[1:])
         return {"raw_content": raw_content}
 
     def serialize_block(self, block: Block[BaseMetadata, BaseContent]) -> str:
@@ -295,56 +328,62 @@ class DelimiterFrontmatterSyntax(BaseSyntax, YAMLFrontmatterMixin):
     Args:
         start_delimiter: Opening delimiter string (default: "!!start")
         end_delimiter: Closing delimiter string (default: "!!end")
+        trust_input: Build metadata without pydantic validation (default: False)
     """
 
     def __init__(
         self,
         start_delimiter: str = "!!start",
         end_delimiter: str = "!!end",
+        *,
+        trust_input: bool = False,
     ) -> None:
         """Initialize delimiter frontmatter syntax.
 
         Args:
             start_delimiter: Starting delimiter
             end_delimiter: Ending delimiter
+            trust_input: Skip metadata validation for trusted streams
         """
         self.start_delimiter = start_delimiter
         self.end_delimiter = end_delimiter
-        self._frontmatter_pattern = re.compile(r"^---\s*$")
+        self.trust_input = trust_input
 
     def detect_line(self, line: str, candidate: BlockCandidate | None = None) -> DetectionResult:
         """Detect delimiter markers and frontmatter boundaries."""
         if candidate is None:
-            # Looking for opening
-            if line.strip() == self.start_delimiter:
-                return DetectionResult(is_opening=True)
-        # Inside a block
+            # Looking for opening; the substring test rejects ordinary text
+            # lines without allocating a stripped copy
+            if self.start_delimiter in line and line.strip() == self.start_delimiter:
+                return _OPENING_DETECTION
+        # Inside a block; content lines are by far the most common, so that
+        # section is tested first
+        elif candidate.current_section == SectionType.CONTENT:
+            if self.end_delimiter in line and line.strip() == self.end_delimiter:
+                return _CLOSING_DETECTION
+            candidate.content_lines.append(line)
         elif candidate.current_section == SectionType.HEADER:
             # Should be frontmatter start
-            if self._frontmatter_pattern.match(line):
+            if self._frontmatter_pattern.fullmatch(line):
                 candidate.transition_to_metadata()
-                return DetectionResult(is_metadata_boundary=True)
+                return _BOUNDARY_DETECTION
             # Skip empty lines in header - frontmatter might follow
-            if line.strip() == "":
-                return DetectionResult()
+            if not line or line.isspace():
+                return _NO_DETECTION
             # Move directly to content if no frontmatter
             candidate.transition_to_content()
             candidate.content_lines.append(line)
         elif candidate.current_section == SectionType.METADATA:
-            if self._frontmatter_pattern.match(line):
+            if self._frontmatter_pattern.fullmatch(line):
                 candidate.transition_to_content()
-                return DetectionResult(is_metadata_boundary=True)
+                return _BOUNDARY_DETECTION
             candidate.metadata_lines.append(line)
-        elif candidate.current_section == SectionType.CONTENT:
-            if line.strip() == self.end_delimiter:
-                return DetectionResult(is_closing=True)
-            candidate.content_lines.append(line)
 
-        return DetectionResult()
+        return _NO_DETECTION
 
     def should_accumulate_metadata(self, candidate: BlockCandidate) -> bool:
         """Check if we're still in metadata section."""
-        return candidate.current_section in {SectionType.HEADER, SectionType.METADATA}
+        return candidate.current_section in _METADATA_SECTIONS
 
     def extract_block_type(self, candidate: BlockCandidate) -> str | None:
         """Extract block_type from YAML frontmatter."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum, auto
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from hother.streamblocks.core.exceptions import SyntaxConfigError
 from hother.streamblocks.syntaxes.base import BaseSyntax
@@ -13,6 +13,9 @@
 )
 from hother.streamblocks.syntaxes.markdown import MarkdownFrontmatterSyntax
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class Syntax(StrEnum):
     """Enum of built-in syntax types."""
@@ -22,6 +25,14 @@ class Syntax(StrEnum):
     MARKDOWN_FRONTMATTER = auto()
 
 
+# Built-in syntax constructors, keyed by enum member
+_SYNTAX_FACTORIES: dict[Syntax, Callable[[], BaseSyntax]] = {
+    Syntax.DELIMITER_FRONTMATTER: DelimiterFrontmatterSyntax,
+    Syntax.DELIMITER_PREAMBLE: DelimiterPreambleSyntax,
+    Syntax.MARKDOWN_FRONTMATTER: MarkdownFrontmatterSyntax,
+}
+
+
 def get_syntax_instance(
     syntax: Syntax | BaseSyntax,
 ) -> BaseSyntax:
@@ -48,13 +59,7 @@ def get_syntax_instance(
         >>> syntax = get_syntax_instance(my_syntax)
     """
     if isinstance(syntax, Syntax):
-        match syntax:
-            case Syntax.DELIMITER_FRONTMATTER:
-                return DelimiterFrontmatterSyntax()
-            case Syntax.DELIMITER_PREAMBLE:
-                return DelimiterPreambleSyntax()
-            case Syntax.MARKDOWN_FRONTMATTER:
-                return MarkdownFrontmatterSyntax()
+        return _SYNTAX_FACTORIES[syntax]()
 
     unchecked = cast("object", syntax)
     if isinstance(unchecked, BaseSyntax):
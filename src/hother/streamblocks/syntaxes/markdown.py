@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Any
 
 import yaml
@@ -14,6 +13,15 @@
 if TYPE_CHECKING:
     from hother.streamblocks.core.models import Block, BlockCandidate, ExtractedBlock
 
+# Sections during which the syntax is still accumulating metadata
+_METADATA_SECTIONS = frozenset({SectionType.HEADER, SectionType.METADATA})
+
+# Shared results for detections that carry no metadata; DetectionResult is frozen
+_NO_DETECTION = DetectionResult()
+_OPENING_DETECTION = DetectionResult(is_opening=True)
+_CLOSING_DETECTION = DetectionResult(is_closing=True)
+_BOUNDARY_DETECTION = DetectionResult(is_metadata_boundary=True)
+
 
 class MarkdownFrontmatterSyntax(BaseSyntax, YAMLFrontmatterMixin):
     """Syntax: Markdown fenced code blocks with YAML frontmatter.
@@ -77,66 +85,67 @@ class MarkdownFrontmatterSyntax(BaseSyntax, YAMLFrontmatterMixin):
     Args:
         fence: Fence string (default: "```")
         info_string: Optional info string used as fallback block_type
+        trust_input: Build metadata without pydantic validation (default: False)
     """
 
     def __init__(
         self,
         fence: str = "```",
         info_string: str | None = None,
+        *,
+        trust_input: bool = False,
     ) -> None:
         """Initialize markdown frontmatter syntax.
 
         Args:
             fence: Fence string (e.g., "```")
             info_string: Optional info string after fence
+            trust_input: Skip metadata validation for trusted streams
         """
         self.fence = fence
         self.info_string = info_string
-        self._fence_pattern = self._build_fence_pattern()
-        self._frontmatter_pattern = re.compile(r"^---\s*$")
-
-    def _build_fence_pattern(self) -> re.Pattern[str]:
-        """Build pattern for fence detection."""
-        pattern_str = rf"^{re.escape(self.fence)}"
-        if self.info_string:
-            pattern_str += re.escape(self.info_string)
-        return re.compile(pattern_str)
+        self.trust_input = trust_input
+        # The opening marker is a literal prefix, so a plain startswith()
+        # check replaces the anchored regex
+        self._opening_prefix = fence + (info_string or "")
 
     def detect_line(self, line: str, candidate: BlockCandidate | None = None) -> DetectionResult:
         """Detect markdown fence markers and frontmatter boundaries."""
         if candidate is None:
             # Looking for opening fence
-            if self._fence_pattern.match(line):
-                return DetectionResult(is_opening=True)
-        # Inside a block
+            if line.startswith(self._opening_prefix):
+                return _OPENING_DETECTION
+        # Inside a block; content lines are by far the most common, so that
+        # section is tested first
+        elif candidate.current_section == SectionType.CONTENT:
+            # Check for closing fence; the substring test rejects ordinary
+            # content lines without allocating a stripped copy
+            if self.fence in line and line.strip() == self.fence:
+                return _CLOSING_DETECTION
+            candidate.content_lines.append(line)
         elif candidate.current_section == SectionType.HEADER:
             # Check if this is frontmatter start
-            if self._frontmatter_pattern.match(line):
+            if self._frontmatter_pattern.fullmatch(line):
                 candidate.transition_to_metadata()
-                return DetectionResult(is_metadata_boundary=True)
+                return _BOUNDARY_DETECTION
             # Skip empty lines in header - frontmatter might follow
-            if line.strip() == "":
-                return DetectionResult()
+            if not line or line.isspace():
+                return _NO_DETECTION
             # Non-empty, non-frontmatter line - move to content
             candidate.transition_to_content()
             candidate.content_lines.append(line)
         elif candidate.current_section == SectionType.METADATA:
             # Check for metadata end
-            if self._frontmatter_pattern.match(line):
+            if self._frontmatter_pattern.fullmatch(line):
                 candidate.transition_to_content()
-                return DetectionResult(is_metadata_boundary=True)
+                return _BOUNDARY_DETECTION
             candidate.metadata_lines.append(line)
-        elif candidate.current_section == SectionType.CONTENT:
-            # Check for closing fence
-            if line.strip() == self.fence:
-                return DetectionResult(is_closing=True)
-            candidate.content_lines.append(line)
 
-        return DetectionResult()
+        return _NO_DETECTION
 
     def should_accumulate_metadata(self, candidate: BlockCandidate) -> bool:
         """Check if we're still in metadata section."""
-        return candidate.current_section in {SectionType.HEADER, SectionType.METADATA}
+        return candidate.current_section in _METADATA_SECTIONS
 
     def extract_block_type(self, candidate: BlockCandidate) -> str | None:
         """Extract block_type from YAML frontmatter."""
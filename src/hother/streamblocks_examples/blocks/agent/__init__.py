@@ -4,59 +4,124 @@
 including communication, tool calling, memory, and interactive blocks.
 """
 
-from hother.streamblocks_examples.blocks.agent.files import (
-    ACTION_MAP,
-    ActionLiteral,
-    FileContent,
-    FileContentContent,
-    FileContentMetadata,
-    FileOperation,
-    FileOperations,
-    FileOperationsContent,
-    FileOperationsMetadata,
-)
-from hother.streamblocks_examples.blocks.agent.interactive import (
-    Choice,
-    ChoiceContent,
-    ChoiceMetadata,
-    Confirm,
-    ConfirmContent,
-    ConfirmMetadata,
-    Form,
-    FormContent,
-    FormField,
-    FormMetadata,
-    Input,
-    InputContent,
-    InputMetadata,
-    InteractiveContent,
-    InteractiveMetadata,
-    MultiChoice,
-    MultiChoiceContent,
-    MultiChoiceMetadata,
-    Ranking,
-    RankingContent,
-    RankingMetadata,
-    Scale,
-    ScaleContent,
-    ScaleMetadata,
-    YesNo,
-    YesNoContent,
-    YesNoMetadata,
-)
-from hother.streamblocks_examples.blocks.agent.memory import Memory, MemoryContent, MemoryMetadata
-from hother.streamblocks_examples.blocks.agent.message import Message, MessageContent, MessageMetadata
-from hother.streamblocks_examples.blocks.agent.patch import Patch, PatchContent, PatchMetadata
-from hother.streamblocks_examples.blocks.agent.structured_output import (
-    StructuredOutputMetadata,
-    create_structured_output_block,
-)
-from hother.streamblocks_examples.blocks.agent.toolcall import ToolCall, ToolCallContent, ToolCallMetadata
-from hother.streamblocks_examples.blocks.agent.visualization import (
-    Visualization,
-    VisualizationContent,
-    VisualizationMetadata,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hother.streamblocks_examples.blocks.agent.files import (
+        ACTION_MAP,
+        ActionLiteral,
+        FileContent,
+        FileContentContent,
+        FileContentMetadata,
+        FileOperation,
+        FileOperations,
+        FileOperationsContent,
+        FileOperationsMetadata,
+    )
+    from hother.streamblocks_examples.blocks.agent.interactive import (
+        Choice,
+        ChoiceContent,
+        ChoiceMetadata,
+        Confirm,
+        ConfirmContent,
+        ConfirmMetadata,
+        Form,
+        FormContent,
+        FormField,
+        FormMetadata,
+        Input,
+        InputContent,
+        InputMetadata,
+        InteractiveContent,
+        InteractiveMetadata,
+        MultiChoice,
+        MultiChoiceContent,
+        MultiChoiceMetadata,
+        Ranking,
+        RankingContent,
+        RankingMetadata,
+        Scale,
+        ScaleContent,
+        ScaleMetadata,
+        YesNo,
+        YesNoContent,
+        YesNoMetadata,
+    )
+    from hother.streamblocks_examples.blocks.agent.memory import Memory, MemoryContent, MemoryMetadata
+    from hother.streamblocks_examples.blocks.agent.message import Message, MessageContent, MessageMetadata
+    from hother.streamblocks_examples.blocks.agent.patch import Patch, PatchContent, PatchMetadata
+    from hother.streamblocks_examples.blocks.agent.structured_output import (
+        StructuredOutputMetadata,
+        create_structured_output_block,
+    )
+    from hother.streamblocks_examples.blocks.agent.toolcall import ToolCall, ToolCallContent, ToolCallMetadata
+    from hother.streamblocks_examples.blocks.agent.visualization import (
+        Visualization,
+        VisualizationContent,
+        VisualizationMetadata,
+    )
+
+# Submodule defining each exported name; submodules are imported on first
+# attribute access (PEP 562) so importing one block family does not build
+# the pydantic models of all the others
+_LAZY_IMPORTS: dict[str, str] = {
+    "ACTION_MAP": "files",
+    "ActionLiteral": "files",
+    "FileContent": "files",
+    "FileContentContent": "files",
+    "FileContentMetadata": "files",
+    "FileOperation": "files",
+    "FileOperations": "files",
+    "FileOperationsContent": "files",
+    "FileOperationsMetadata": "files",
+    "Choice": "interactive",
+    "ChoiceContent": "interactive",
+    "ChoiceMetadata": "interactive",
+    "Confirm": "interactive",
+    "ConfirmContent": "interactive",
+    "ConfirmMetadata": "interactive",
+    "Form": "interactive",
+    "FormContent": "interactive",
+    "FormField": "interactive",
+    "FormMetadata": "interactive",
+    "Input": "interactive",
+    "InputContent": "interactive",
+    "InputMetadata": "interactive",
+    "InteractiveContent": "interactive",
+    "InteractiveMetadata": "interactive",
+    "MultiChoice": "interactive",
+    "MultiChoiceContent": "interactive",
+    "MultiChoiceMetadata": "interactive",
+    "Ranking": "interactive",
+    "RankingContent": "interactive",
+    "RankingMetadata": "interactive",
+    "Scale": "interactive",
+    "ScaleContent": "interactive",
+    "ScaleMetadata": "interactive",
+    "YesNo": "interactive",
+    "YesNoContent": "interactive",
+    "YesNoMetadata": "interactive",
+    "Memory": "memory",
+    "MemoryContent": "memory",
+    "MemoryMetadata": "memory",
+    "Message": "message",
+    "MessageContent": "message",
+    "MessageMetadata": "message",
+    "Patch": "patch",
+    "PatchContent": "patch",
+    "PatchMetadata": "patch",
+    "StructuredOutputMetadata": "structured_output",
+    "create_structured_output_block": "structured_output",
+    "ToolCall": "toolcall",
+    "ToolCallContent": "toolcall",
+    "ToolCallMetadata": "toolcall",
+    "Visualization": "visualization",
+    "VisualizationContent": "visualization",
+    "VisualizationMetadata": "visualization",
+}
 
 __all__ = [
     "ACTION_MAP",
@@ -113,3 +178,19 @@
     "YesNoMetadata",
     "create_structured_output_block",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -14,6 +14,12 @@
 # Action code mapping with proper typing
 ACTION_MAP: Final[dict[str, ActionLiteral]] = {"C": "create", "E": "edit", "D": "delete"}
 
+# Case-insensitive lookup table so parsing needs no per-line upper()
+_ACTION_LOOKUP: Final[dict[str, ActionLiteral]] = {
+    **ACTION_MAP,
+    **{code.lower(): action for code, action in ACTION_MAP.items()},
+}
+
 
 class FileOperation(BaseModel):
     """Single file operation."""
@@ -22,6 +28,22 @@ class FileOperation(BaseModel):
     path: str
 
 
+def _parse_operation(line: str) -> FileOperation:
+    """Parse one stripped, non-empty ``path:CODE`` line."""
+    path, sep, action = line.rpartition(":")
+    if not sep:
+        msg = f"Invalid format: {line}"
+        raise ValueError(msg)
+
+    action_literal = _ACTION_LOOKUP.get(action)
+    if action_literal is None:
+        msg = f"Unknown action: {action}"
+        raise ValueError(msg)
+
+    # Both fields are already known-good here, so skip per-row validation
+    return FileOperation.model_construct(action=action_literal, path=path.rstrip())
+
+
 class FileOperationsContent(BaseContent):
     """Content model for file operations blocks."""
 
@@ -37,30 +59,8 @@ def parse(cls, raw_text: str) -> FileOperationsContent:
 
         Where C=create, E=edit, D=delete
         """
-        operations: list[FileOperation] = []
-        for line in raw_text.strip().split("\n"):
-            if not line.strip():
-                continue
-
-            if ":" not in line:
-                msg = f"Invalid format: {line}"
-                raise ValueError(msg)
-
-            path, action = line.rsplit(":", 1)
-
-            if action.upper() not in ACTION_MAP:
-                msg = f"Unknown action: {action}"
-                raise ValueError(msg)
-
-            action_literal = ACTION_MAP[action.upper()]
-
-            operations.append(
-                FileOperation(
-                    action=action_literal,
-                    path=path.strip(),
-                )
-            )
-
+        stripped_lines = (raw_line.strip() for raw_line in raw_text.splitlines())
+        operations = [_parse_operation(line) for line in stripped_lines if line]
         return cls(raw_content=raw_text, operations=operations)
 
 
@@ -16,22 +16,14 @@ class PatchContent(BaseContent):
     @classmethod
     def parse(cls, raw_text: str) -> "PatchContent":
         """Parse and validate patch content."""
-        # Basic validation
-        if not raw_text.strip():
+        diff = raw_text.strip()
+        if not diff:
             msg = "Empty patch"
             raise ValueError(msg)
 
-        # For now, accept any content that looks like it has changes
-        # (lines starting with +, -, or space for context)
-        lines = raw_text.strip().split("\n")
-        has_diff_lines = any(line.startswith(("+", "-", " ")) for line in lines)
-
-        if not has_diff_lines:
-            # If no obvious diff markers, just accept it as is
-            # This allows for more flexible patch formats
-            pass
-
-        return cls(raw_content=raw_text, diff=raw_text.strip())
+        # Any non-empty content is accepted, with or without +/-/space diff
+        # markers, to allow for more flexible patch formats
+        return cls(raw_content=raw_text, diff=diff)
 
 
 class PatchMetadata(BaseMetadata):
@@ -0,0 +1,29 @@
+"""Tests for the lazy exports of the agent blocks package."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+import hother.streamblocks_examples.blocks.agent as agent_blocks
+
+
+class TestLazyExports:
+    """Tests for the PEP 562 module __getattr__."""
+
+    @pytest.mark.parametrize("name", agent_blocks.__all__)
+    def test_exported_name_matches_submodule(self, name: str) -> None:
+        """Test that each exported name resolves to its submodule object."""
+        module = importlib.import_module(f"{agent_blocks.__name__}.{agent_blocks._LAZY_IMPORTS[name]}")
+
+        assert getattr(agent_blocks, name) is getattr(module, name)
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="NotABlock"):
+            _ = agent_blocks.NotABlock  # type: ignore[attr-defined]
+
+    def test_dir_lists_exports(self) -> None:
+        """Test that dir() includes names not imported yet."""
+        assert set(agent_blocks.__all__) <= set(dir(agent_blocks))
@@ -87,6 +87,19 @@ def test_parse_path_with_colon(self) -> None:
         assert content.operations[0].path == "C:\\path\\to\\file.py"
         assert content.operations[0].action == "create"
 
+    def test_parse_operations_equal_validated_models(self) -> None:
+        """Test that parsed operations match normally validated models."""
+        content = FileOperationsContent.parse("src/a.py:C\n  src/b.py :e")
+        assert content.operations == [
+            FileOperation(action="create", path="src/a.py"),
+            FileOperation(action="edit", path="src/b.py"),
+        ]
+
+    def test_parse_handles_crlf_line_endings(self) -> None:
+        """Test that Windows line endings do not leak into action codes."""
+        content = FileOperationsContent.parse("a.py:C\r\nb.py:D\r\n")
+        assert [op.action for op in content.operations] == ["create", "delete"]
+
 
 class TestFileContentContentParse:
     """Tests for FileContentContent.parse()."""
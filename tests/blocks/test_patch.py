@@ -128,10 +128,7 @@ def test_parse_content_without_diff_markers(self) -> None:
         assert content.diff == content_text.strip()
 
     def test_parse_content_no_diff_markers_at_all(self) -> None:
-        """Test parsing content with NO lines starting with +, -, or space.
-
-        This covers line 32 of patch.py (has_diff_lines = False branch).
-        """
+        """Test parsing content with NO lines starting with +, -, or space."""
         # Content where NO line starts with +, -, or space
         content_text = "header_line\nanother_line\nfinal_line"
         content = PatchContent.parse(content_text)
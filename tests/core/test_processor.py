@@ -77,6 +77,7 @@ def test_default_config_values(self) -> None:
         assert config.emit_original_events is True
         assert config.emit_text_deltas is True
         assert config.emit_section_end_events is True
+        assert config.emit_block_deltas is True
         assert config.auto_detect_adapter is True
 
     def test_custom_config_values(self) -> None:
@@ -41,6 +41,22 @@ def test_init_disable_partial_blocks(self) -> None:
         processor = AgentStreamProcessor(registry, enable_partial_blocks=False)
 
         assert processor.enable_partial_blocks is False
+        assert processor.config.emit_block_deltas is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_partial_blocks_skip_delta_events(self) -> None:
+        """Test that no section delta events are emitted when partial blocks are disabled."""
+        registry = Registry(syntax=DelimiterPreambleSyntax())
+        config = ProcessorConfig(emit_text_deltas=False, emit_original_events=False)
+        processor = AgentStreamProcessor(registry, config=config, enable_partial_blocks=False)
+
+        async def stream() -> Any:
+            yield "!!b1:note\nline one\nline two\n!!end\n"
+
+        event_types = [event.type async for event in processor.process_agent_stream(stream())]  # type: ignore[union-attr]
+
+        assert EventType.BLOCK_CONTENT_DELTA not in event_types
+        assert EventType.BLOCK_START in event_types
 
 
 class TestAgentStreamProcessorProcessAgentStream:
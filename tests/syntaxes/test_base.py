@@ -9,7 +9,7 @@
 import yaml
 
 from hother.streamblocks.core.types import BaseContent, BaseMetadata, DetectionResult, ParseResult
-from hother.streamblocks.syntaxes.base import BaseSyntax, YAMLFrontmatterMixin
+from hother.streamblocks.syntaxes.base import BaseSyntax, YAMLFrontmatterMixin, _try_simple_yaml
 
 
 class TestYAMLFrontmatterMixinParseYamlMetadata:
@@ -90,6 +90,17 @@ def test_parse_yaml_list(self) -> None:
 
         assert result == {"items": ["one", "two", "three"]}
 
+    def test_repeated_parse_returns_independent_results(self) -> None:
+        """Test that cached YAML loads are not shared between callers."""
+        mixin = YAMLFrontmatterMixin()
+        lines = ["tags:", "  - a", "  - b"]
+
+        first = mixin._parse_yaml_metadata(lines)
+        assert first is not None
+        first["tags"].append("mutated")
+
+        assert mixin._parse_yaml_metadata(lines) == {"tags": ["a", "b"]}
+
 
 class TestYAMLFrontmatterMixinParseYamlMetadataStrict:
     """Tests for YAMLFrontmatterMixin._parse_yaml_metadata_strict()."""
@@ -156,6 +167,52 @@ def test_parse_multiline_error_returns_correct_exception(self) -> None:
         assert isinstance(error, yaml.YAMLError)
 
 
+class TestTrySimpleYaml:
+    """Tests for the flat key: value fast path."""
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["id: block_001", "block_type: message"],
+            ["id: msg-1", "", "title: Fix the login bug", "path: src/app/main.py"],
+            ["description:", "block_type: task"],
+            ["id: a", "id: b"],
+        ],
+    )
+    def test_matches_yaml_safe_load(self, lines: list[str]) -> None:
+        """Test that the fast path returns exactly what YAML would."""
+        assert _try_simple_yaml(lines) == yaml.safe_load("\n".join(lines))
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["count: 42"],
+            ["enabled: true"],
+            ["answer: no"],
+            ["value: null"],
+            ["title: 'quoted'"],
+            ["tags: [a, b]"],
+            ["items:", "  - a"],
+            ["note: text # comment"],
+            ["key: a: b"],
+            ["# comment"],
+            ["key:\tvalue"],
+            ["\t"],
+        ],
+    )
+    def test_defers_to_yaml_for_non_trivial_lines(self, lines: list[str]) -> None:
+        """Test that anything beyond plain string values falls back to YAML."""
+        assert _try_simple_yaml(lines) is None
+
+    def test_mixin_results_unchanged_for_mixed_frontmatter(self) -> None:
+        """Test that the mixin still returns YAML-typed values."""
+        mixin = YAMLFrontmatterMixin()
+        lines = ["id: block_001", "priority: 3"]
+
+        assert mixin._parse_yaml_metadata(lines) == {"id": "block_001", "priority": 3}
+        assert mixin._parse_yaml_metadata_strict(lines) == ({"id": "block_001", "priority": 3}, None)
+
+
 class ConcreteSyntax(BaseSyntax):
     """Concrete implementation of BaseSyntax for testing."""
 
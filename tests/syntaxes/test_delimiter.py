@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from pydantic import ValidationError
+import pytest
+from pydantic import BaseModel, ValidationError
 
 from hother.streamblocks.core.models import Block, BlockCandidate
 from hother.streamblocks.core.types import BaseContent, BaseMetadata, SectionType
@@ -80,6 +81,18 @@ def test_detect_with_custom_delimiter(self) -> None:
         assert result.is_opening is True
         assert result.metadata["id"] == "myblock"
 
+    def test_non_matching_lines_share_frozen_result(self) -> None:
+        """Test that plain lines reuse one immutable detection result."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = MagicMock(spec=BlockCandidate)
+
+        first = syntax.detect_line("regular text")
+        second = syntax.detect_line("more content", candidate)
+
+        assert first is second
+        with pytest.raises(ValidationError):
+            first.is_opening = True  # type: ignore[misc]
+
 
 class TestDelimiterPreambleSyntaxShouldAccumulateMetadata:
     """Tests for DelimiterPreambleSyntax.should_accumulate_metadata()."""
@@ -112,6 +125,7 @@ def test_extract_block_type_success(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file", "content", "!!end"]
+        candidate.opening_detection = None
 
         result = syntax.extract_block_type(candidate)
 
@@ -122,6 +136,7 @@ def test_extract_block_type_no_metadata(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["not a valid opening line"]
+        candidate.opening_detection = None
 
         result = syntax.extract_block_type(candidate)
 
@@ -136,6 +151,7 @@ def test_parse_block_missing_metadata(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["not a valid opening", "content", "!!end"]
+        candidate.opening_detection = None
 
         result = syntax.parse_block(candidate)
 
@@ -145,7 +161,7 @@ def test_parse_block_missing_metadata(self) -> None:
     def test_parse_block_success(self) -> None:
         """Test successful block parsing."""
         syntax = DelimiterPreambleSyntax()
-        candidate = MagicMock(spec=BlockCandidate)
+        candidate = BlockCandidate(syntax, start_line=1)
         candidate.lines = ["!!myblock:file", "content here", "!!end"]
 
         result = syntax.parse_block(candidate)
@@ -160,6 +176,7 @@ def test_parse_block_with_custom_metadata_validation_error(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file", "content", "!!end"]
+        candidate.opening_detection = None
 
         class StrictMetadata(BaseMetadata):
             required_field: str  # This is required but won't be provided
@@ -178,6 +195,7 @@ def test_parse_block_with_content_validation_error(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file", "content", "!!end"]
+        candidate.opening_detection = None
 
         class FailingContent(BaseContent):
             @classmethod
@@ -197,6 +215,7 @@ def test_parse_block_with_content_value_error(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file", "bad content", "!!end"]
+        candidate.opening_detection = None
 
         class FailingContent(BaseContent):
             @classmethod
@@ -219,6 +238,7 @@ def test_parse_block_metadata_type_error(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file", "content", "!!end"]
+        candidate.opening_detection = None
 
         class BadMetadata:
             def __init__(self, **kwargs: Any) -> None:
@@ -239,9 +259,60 @@ class FakeBlock:
         assert "Invalid metadata" in result.error
 
 
+class TestDelimiterPreambleSyntaxTrustInput:
+    """Tests for DelimiterPreambleSyntax with trust_input enabled."""
+
+    class CountMetadata(BaseMetadata):
+        param_0: int = 0
+
+    class CountBlock(Block[CountMetadata, BaseContent]):
+        pass
+
+    def test_default_validates_and_coerces(self) -> None:
+        """Test that metadata is validated unless trust_input is set."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = BlockCandidate(syntax, start_line=1)
+        candidate.lines = ["!!b1:count:7", "body", "!!end"]
+
+        result = syntax.parse_block(candidate, self.CountBlock)
+
+        assert result.success is True
+        assert result.metadata is not None
+        assert result.metadata.param_0 == 7
+
+    def test_trust_input_skips_validation(self) -> None:
+        """Test that trusted metadata is constructed without coercion."""
+        syntax = DelimiterPreambleSyntax(trust_input=True)
+        candidate = BlockCandidate(syntax, start_line=1)
+        candidate.lines = ["!!b1:count:7", "body", "!!end"]
+
+        result = syntax.parse_block(candidate, self.CountBlock)
+
+        assert result.success is True
+        assert isinstance(result.metadata, self.CountMetadata)
+        assert result.metadata.id == "b1"
+        assert result.metadata.param_0 == "7"
+
+
 class TestDelimiterPreambleSyntaxParseMetadataEarly:
     """Tests for DelimiterPreambleSyntax.parse_metadata_early()."""
 
+    def test_reuses_opening_detection(self) -> None:
+        """Test that the opening line is not re-parsed after detection."""
+        syntax = DelimiterPreambleSyntax()
+        detection = syntax.detect_line("!!b1:note:x", None)
+        candidate = BlockCandidate(syntax, start_line=1)
+        candidate.add_line("!!b1:note:x")
+        candidate.opening_detection = detection
+
+        with patch.object(syntax, "_opening_pattern") as pattern:
+            result = syntax.parse_metadata_early(candidate)
+            assert syntax.extract_block_type(candidate) == "note"
+
+        pattern.fullmatch.assert_not_called()
+        assert result == detection.metadata
+        assert result is not detection.metadata
+
     def test_parse_metadata_early_empty_lines(self) -> None:
         """Test parse_metadata_early with empty candidate lines (lines 147-148)."""
         syntax = DelimiterPreambleSyntax()
@@ -257,6 +328,7 @@ def test_parse_metadata_early_no_match(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["not a valid opening line"]
+        candidate.opening_detection = None
 
         result = syntax.parse_metadata_early(candidate)
 
@@ -267,6 +339,7 @@ def test_parse_metadata_early_success(self) -> None:
         syntax = DelimiterPreambleSyntax()
         candidate = MagicMock(spec=BlockCandidate)
         candidate.lines = ["!!myblock:file:extra"]
+        candidate.opening_detection = None
 
         result = syntax.parse_metadata_early(candidate)
 
@@ -302,7 +375,7 @@ def test_parse_content_early_two_lines(self) -> None:
     def test_parse_content_early_multiple_lines(self) -> None:
         """Test parse_content_early with multiple content lines."""
         syntax = DelimiterPreambleSyntax()
-        candidate = MagicMock(spec=BlockCandidate)
+        candidate = BlockCandidate(syntax, start_line=1)
         candidate.lines = ["!!myblock:file", "line1", "line2", "!!end"]
 
         result = syntax.parse_content_early(candidate)
@@ -310,10 +383,35 @@ def test_parse_content_early_multiple_lines(self) -> None:
         assert result is not None
         assert result["raw_content"] == "line1\nline2"
 
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["!!b:t", "!!end"],
+            ["!!b:t", "", "!!end"],
+            ["!!b:t", "a", "", "b", "!!end"],
+            ["!!b:t:p", "  indented", "!!end"],
+        ],
+    )
+    def test_content_matches_joined_inner_lines(self, lines: list[str]) -> None:
+        """Test that content sliced from raw_text equals joining the inner lines."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = BlockCandidate(syntax, start_line=1)
+        for line in lines:
+            candidate.add_line(line)
+
+        result = syntax.parse_block(candidate)
+
+        assert result.content is not None
+        assert result.content.raw_content == "\n".join(lines[1:-1])
+
 
 class TestDelimiterFrontmatterSyntaxDetectLine:
     """Tests for DelimiterFrontmatterSyntax.detect_line()."""
 
+    def test_frontmatter_pattern_shared_between_instances(self) -> None:
+        """Test that the boundary regex is compiled once, not per instance."""
+        assert DelimiterFrontmatterSyntax()._frontmatter_pattern is DelimiterFrontmatterSyntax()._frontmatter_pattern
+
     def test_detect_opening(self) -> None:
         """Test detecting opening delimiter."""
         syntax = DelimiterFrontmatterSyntax()
@@ -503,6 +601,74 @@ def test_extract_block_type_no_block_type_key(self) -> None:
 class TestDelimiterFrontmatterSyntaxParseBlock:
     """Tests for DelimiterFrontmatterSyntax.parse_block()."""
 
+    def test_parse_block_trust_input_reports_missing_required_fields(self) -> None:
+        """Test that trusted frontmatter without block_type fails to parse."""
+        syntax = DelimiterFrontmatterSyntax(trust_input=True)
+        candidate = MagicMock(spec=BlockCandidate)
+        candidate.metadata_lines = ["foo: bar"]
+        candidate.content_lines = ["content"]
+
+        result = syntax.parse_block(candidate)
+
+        assert result.success is False
+        assert result.error is not None
+        assert "missing required fields id, block_type" in result.error
+
+    def test_trust_input_missing_block_type_emits_error_event(self) -> None:
+        """Test that a stream with untyped trusted metadata reports an error instead of crashing."""
+        from hother.streamblocks import BlockErrorEvent, Registry, StreamBlockProcessor
+
+        processor = StreamBlockProcessor(Registry(syntax=DelimiterFrontmatterSyntax(trust_input=True)))
+
+        events = processor.process_chunk("!!start\n---\nid: b1\nfoo: bar\n---\nbody\n!!end\n")
+        events.extend(processor.finalize())
+
+        errors = [event for event in events if isinstance(event, BlockErrorEvent)]
+        assert len(errors) == 1
+        assert "block_type" in errors[0].reason
+
+    def test_parse_block_trust_input_fills_defaults(self) -> None:
+        """Test that trusted frontmatter still receives model defaults."""
+        syntax = DelimiterFrontmatterSyntax(trust_input=True)
+        candidate = MagicMock(spec=BlockCandidate)
+        candidate.metadata_lines = ["id: t1", "block_type: task"]
+        candidate.content_lines = ["content"]
+
+        class TaskMetadata(BaseMetadata):
+            priority: str = "normal"
+
+        class TaskBlock(Block[TaskMetadata, BaseContent]):
+            pass
+
+        result = syntax.parse_block(candidate, TaskBlock)
+
+        assert result.success is True
+        assert result.metadata is not None
+        assert result.metadata.priority == "normal"
+
+    def test_parse_block_trust_input_builds_nested_metadata(self) -> None:
+        """Test that trusted frontmatter builds nested metadata models."""
+        syntax = DelimiterFrontmatterSyntax(trust_input=True)
+        candidate = MagicMock(spec=BlockCandidate)
+        candidate.metadata_lines = ["id: t1", "block_type: task", "owner:", "  name: alice"]
+        candidate.content_lines = ["content"]
+
+        class Owner(BaseModel):
+            name: str
+
+        class OwnedMetadata(BaseMetadata):
+            owner: Owner
+
+        class OwnedBlock(Block[OwnedMetadata, BaseContent]):
+            pass
+
+        result = syntax.parse_block(candidate, OwnedBlock)
+
+        assert result.success is True
+        assert result.metadata is not None
+        assert isinstance(result.metadata.owner, Owner)
+        assert result.metadata.owner.name == "alice"
+
     def test_parse_block_yaml_error(self) -> None:
         """Test parse_block with invalid YAML (line 255)."""
         syntax = DelimiterFrontmatterSyntax()
@@ -573,6 +573,14 @@ def test_fence_pattern_matches_info_string_prefix(self) -> None:
         # Should also match longer info strings starting with py
         assert syntax.detect_line("```python").is_opening is True
 
+    def test_fence_info_string_is_matched_literally(self) -> None:
+        """Test that regex metacharacters in the info string match literally."""
+        syntax = MarkdownFrontmatterSyntax(info_string="c++")
+
+        assert syntax.detect_line("```c++").is_opening is True
+        assert syntax.detect_line("```c").is_opening is False
+        assert syntax.detect_line("```cc").is_opening is False
+
     def test_custom_fence_syntax(self) -> None:
         """Test using custom fence characters."""
         syntax = MarkdownFrontmatterSyntax(fence="~~~")
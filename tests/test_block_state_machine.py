@@ -73,6 +73,15 @@ def test_block_opening_detected(self, machine: BlockStateMachine) -> None:
         assert events[0].start_line == 1
         assert machine.has_active_candidates
 
+    def test_opening_detection_recorded_on_candidate(self, machine: BlockStateMachine) -> None:
+        """The opening line's detection should be kept on the candidate."""
+        machine.process_line("!!test:files_operations", 1)
+
+        detection = machine.candidates[0].opening_detection
+        assert detection is not None
+        assert detection.is_opening
+        assert detection.metadata == {"id": "test", "block_type": "files_operations"}
+
     def test_block_id_assigned(self, machine: BlockStateMachine) -> None:
         """Block should get unique ID on opening."""
         events = machine.process_line("!!test:files_operations", 1)
@@ -163,6 +172,22 @@ def test_size_exceeded_error(self, syntax: DelimiterPreambleSyntax, registry: Re
         assert len(error_events) == 1
         assert error_events[0].error_code == BlockErrorCode.SIZE_EXCEEDED
 
+    def test_size_limit_counts_joined_text_length(self, syntax: DelimiterPreambleSyntax, registry: Registry) -> None:
+        """The limit applies to the newline-joined text, inclusive of the limit itself."""
+        header = "!!test:files_operations"
+        line = "a.py:C"
+        limit = len(header) + 1 + len(line)
+
+        at_limit = BlockStateMachine(syntax, registry, max_block_size=limit)
+        at_limit.process_line(header, 1)
+        events = at_limit.process_line(line, 2)
+        assert not any(isinstance(e, BlockErrorEvent) for e in events)
+
+        over_limit = BlockStateMachine(syntax, registry, max_block_size=limit - 1)
+        over_limit.process_line(header, 1)
+        events = over_limit.process_line(line, 2)
+        assert [e.error_code for e in events if isinstance(e, BlockErrorEvent)] == [BlockErrorCode.SIZE_EXCEEDED]
+
 
 class TestMultipleBlocks:
     """Tests for processing multiple blocks."""
@@ -93,6 +93,18 @@ def test_multiple_chunks_one_line(self) -> None:
         assert result[0] == (1, "abcd")
         assert result[1] == (2, "")
 
+    def test_pending_fragments_joined_only_at_newline(self) -> None:
+        """Chunks without a newline are buffered as-is until a line completes."""
+        acc = LineAccumulator()
+
+        acc.add_text("ab")
+        acc.add_text("cd")
+        assert acc._accumulated_text == ["ab", "cd"]
+
+        result = acc.add_text("e\nfg")
+        assert result == [(1, "abcde")]
+        assert acc._accumulated_text == ["fg"]
+
 
 class TestLineAccumulatorFinalize:
     """Tests for finalize behavior."""
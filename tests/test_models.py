@@ -1,6 +1,9 @@
 """Tests for core models."""
 
+import hashlib
+
 from hother.streamblocks import DelimiterPreambleSyntax
+from hother.streamblocks.core.constants import LIMITS
 from hother.streamblocks.core.models import BlockCandidate, extract_block_types
 from hother.streamblocks.core.types import BaseContent, BaseMetadata, BlockState
 
@@ -76,6 +79,66 @@ def test_repr_is_valid_string(self) -> None:
         assert "1" in repr_str  # lines=1
         assert "content" in repr_str
 
+    def test_raw_text_is_memoized_until_lines_change(self) -> None:
+        """Test that raw_text is reused and refreshed when lines change."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = BlockCandidate(syntax, start_line=1)
+        candidate.add_line("first")
+
+        assert candidate.raw_text == "first"
+        assert candidate.raw_text is candidate.raw_text
+
+        candidate.add_line("second")
+        assert candidate.raw_text == "first\nsecond"
+
+        candidate.lines = ["replaced"]
+        assert candidate.raw_text == "replaced"
+
+    def test_size_tracks_raw_text_length(self) -> None:
+        """Test that size matches len(raw_text) as lines are added or replaced."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = BlockCandidate(syntax, start_line=1)
+        assert candidate.size == 0
+
+        for line in ["!!a:note", "", "body line", ""]:
+            candidate.add_line(line)
+            assert candidate.size == len(candidate.raw_text)
+
+        candidate.lines = ["x", "yz"]
+        assert candidate.size == len(candidate.raw_text) == 4
+
+        candidate.lines = []
+        assert candidate.size == 0
+
+    def test_replacing_lines_drops_opening_detection(self) -> None:
+        """Test that assigning lines forgets the old opening's detection."""
+        syntax = DelimiterPreambleSyntax()
+        candidate = BlockCandidate(syntax, start_line=1)
+        candidate.add_line("!!a:note")
+        candidate.opening_detection = syntax.detect_line("!!a:note")
+
+        candidate.lines = ["!!b:task", "body", "!!end"]
+
+        assert candidate.opening_detection is None
+        assert syntax.extract_block_type(candidate) == "task"
+
+    def test_compute_hash_uses_raw_text_prefix(self) -> None:
+        """Test that compute_hash matches hashing the raw text prefix."""
+        syntax = DelimiterPreambleSyntax()
+        for lines in (
+            [],
+            ["short"],
+            ["a" * 63, "b"],
+            ["a" * 64, "b"],
+            ["x" * 10] * 20,
+        ):
+            candidate = BlockCandidate(syntax, start_line=1)
+            for line in lines:
+                candidate.add_line(line)
+
+            expected = hashlib.sha256(candidate.raw_text[: LIMITS.HASH_PREFIX_LENGTH].encode()).hexdigest()[:8]
+            assert candidate.compute_hash() == expected
+
 
 class TestExtractBlockTypes:
     """Tests for extract_block_types function."""
@@ -154,3 +217,145 @@ class MockBlock(BaseModel):
 
         assert metadata is BaseMetadata
         assert content is BaseContent
+
+    def test_block_subclass_records_resolved_types(self) -> None:
+        """Test that Block subclasses cache their types at class creation."""
+        from hother.streamblocks.core.models import Block
+
+        class NoteMetadata(BaseMetadata):
+            title: str = ""
+
+        class Note(Block[NoteMetadata, BaseContent]):
+            pass
+
+        assert Note.__block_types__ == (NoteMetadata, BaseContent)
+        assert extract_block_types(Note) == (NoteMetadata, BaseContent)
+
+
+class TestFromTrustedDict:
+    """Tests for Block.from_trusted_dict."""
+
+    def test_round_trips_model_dump(self) -> None:
+        """Test that a dumped block is rebuilt with its declared classes."""
+        from hother.streamblocks.core.models import Block, ExtractedBlock
+
+        class NoteMetadata(BaseMetadata):
+            title: str = ""
+
+        class Note(Block[NoteMetadata, BaseContent]):
+            pass
+
+        class ExtractedNote(ExtractedBlock[NoteMetadata, BaseContent]):
+            pass
+
+        original = ExtractedNote(
+            metadata=NoteMetadata(id="n1", block_type="note", title="Hello"),
+            content=BaseContent(raw_content="body"),
+            syntax_name="DelimiterPreambleSyntax",
+            raw_text="!!n1:note\nbody\n!!end",
+            line_start=1,
+            line_end=3,
+            hash_id="abcd1234",
+        )
+
+        restored = ExtractedNote.from_trusted_dict(original.model_dump())
+
+        assert restored == original
+        assert isinstance(restored.metadata, NoteMetadata)
+        assert isinstance(Note.from_trusted_dict(original.model_dump()).content, BaseContent)
+
+    def test_skips_validation(self) -> None:
+        """Test that no validation is performed on trusted input."""
+        from hother.streamblocks.core.models import Block
+
+        class Note(Block[BaseMetadata, BaseContent]):
+            pass
+
+        restored = Note.from_trusted_dict({"metadata": {"id": 1, "block_type": "note"}, "content": {"raw_content": ""}})
+
+        assert restored.metadata.id == 1
+
+    def test_rebuilds_nested_models(self) -> None:
+        """Test that nested model fields are rebuilt instead of left as dicts."""
+        from pydantic import BaseModel
+
+        from hother.streamblocks.core.models import Block
+
+        class Item(BaseModel):
+            name: str
+
+        class Other(BaseModel):
+            label: str
+
+        class NestedContent(BaseContent):
+            item: Item
+            items: list[Item]
+            by_key: dict[str, Item]
+            maybe: Item | None = None
+            either: Item | Other | None = None
+            tags: list[str] = []
+            note: str = ""
+
+        class Nested(Block[BaseMetadata, NestedContent]):
+            pass
+
+        original = Nested(
+            metadata=BaseMetadata(id="n1", block_type="nested"),
+            content=NestedContent(
+                raw_content="",
+                item=Item(name="a"),
+                items=[Item(name="b")],
+                by_key={"k": Item(name="c")},
+                either=Other(label="d"),
+                tags=["x"],
+            ),
+        )
+        data = original.model_dump()
+        del data["content"]["note"]
+
+        restored = Nested.from_trusted_dict(data)
+
+        assert isinstance(restored.content.item, Item)
+        assert isinstance(restored.content.items[0], Item)
+        assert isinstance(restored.content.by_key["k"], Item)
+        assert restored.content.maybe is None
+        # A union of several models cannot be resolved without validation
+        assert restored.content.either == {"label": "d"}
+        assert restored.content.tags == ["x"]
+
+    def test_round_trips_file_operations(self) -> None:
+        """Test that a block with a list of nested models round-trips equal."""
+        from hother.streamblocks_examples.blocks.agent.files import (
+            FileOperation,
+            FileOperations,
+            FileOperationsContent,
+            FileOperationsMetadata,
+        )
+
+        original = FileOperations(
+            metadata=FileOperationsMetadata(id="f1", block_type="files_operations"),
+            content=FileOperationsContent(
+                raw_content="a.py:C",
+                operations=[FileOperation(action="create", path="a.py")],
+            ),
+        )
+
+        restored = FileOperations.from_trusted_dict(original.model_dump())
+
+        assert restored == original
+        assert restored.model_dump() == original.model_dump()
+
+    def test_keeps_model_instances(self) -> None:
+        """Test that metadata and content given as model instances are kept."""
+        from hother.streamblocks.core.models import Block
+
+        class Note(Block[BaseMetadata, BaseContent]):
+            pass
+
+        metadata = BaseMetadata(id="n1", block_type="note")
+        content = BaseContent(raw_content="body")
+
+        restored = Note.from_trusted_dict({"metadata": metadata, "content": content})
+
+        assert restored.metadata is metadata
+        assert restored.content is content
@@ -171,6 +171,21 @@ def test_parse_as_json_strict_invalid() -> None:
         StrictJSONContent.parse(invalid_json)
 
 
+@pytest.mark.parametrize(
+    "raw_text",
+    [
+        '{"status": 1, "data": {"big": 123456789012345678901234567890}}',
+        '{"status": 1, "data": {"s": "\\u00e9", "items": [1.5, null, true]}}',
+        '{"status": 1, "data": {"lone": "\\ud800"}}',
+    ],
+)
+def test_parse_as_json_matches_stdlib_json(raw_text: str) -> None:
+    """Test that JSON decoding gives the same data as json.loads."""
+    content = JSONTestContent.parse(raw_text)
+
+    assert content.data == json.loads(raw_text)["data"]
+
+
 def test_parse_as_json_non_dict_wrapped() -> None:
     """Test non-dict JSON values are wrapped in {value: ...}."""
 
@@ -295,3 +295,33 @@ async def mock_stream() -> Any:
     async for event in processor.process_stream(mock_stream()):
         if isinstance(event, BlockHeaderDeltaEvent | BlockMetadataDeltaEvent | BlockContentDeltaEvent):
             assert event.syntax == "DelimiterFrontmatterSyntax"
+
+
+@pytest.mark.asyncio
+async def test_block_deltas_can_be_disabled() -> None:
+    """Test that emit_block_deltas=False drops delta events but still extracts blocks."""
+    syntax = DelimiterFrontmatterSyntax()
+    registry = Registry(syntax=syntax)
+    from hother.streamblocks.core.processor import ProcessorConfig
+
+    config = ProcessorConfig(emit_text_deltas=False, emit_block_deltas=False)
+    processor = StreamBlockProcessor(registry, config=config)
+
+    async def mock_stream() -> Any:
+        text = """!!start
+---
+id: test
+block_type: generic
+---
+Content.
+!!end"""
+        for line in text.split("\n"):
+            yield line + "\n"
+
+    event_types = [event.type async for event in processor.process_stream(mock_stream())]
+
+    assert EventType.BLOCK_START in event_types
+    assert EventType.BLOCK_END in event_types
+    assert EventType.BLOCK_HEADER_DELTA not in event_types
+    assert EventType.BLOCK_METADATA_DELTA not in event_types
+    assert EventType.BLOCK_CONTENT_DELTA not in event_types